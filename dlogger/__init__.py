@@ -1,17 +1,13 @@
 from .logger import logger, dLogger
-from .handlers import Handler, ConsoleHandler, FileHandler, LogRecord, Filter
-from .formatters import Formatter, SimpleFormatter, ExceptionFormatter
-from .filters import LevelFilter, KeywordFilter, ModuleFilter
-from .integrations import uvicorn_config, load
-from .handlers.compat import CompatHandler
+from .handlers.base import Handler, LogRecord, Filter, Formatter
+from ._lazy import lazy_loader
 
 __version__ = "0.3.7"
 
-import threading
+from .registry import LoggerRegistry
 
-_loggers = {}
 _MAX_LOGGERS = 128
-_lock = threading.Lock()
+_registry = LoggerRegistry(_MAX_LOGGERS)
 
 
 def get_logger(name: str = None):
@@ -26,22 +22,29 @@ def get_logger(name: str = None):
     if name is None:
         return logger
 
-    with _lock:
-        if name in _loggers:
-            return _loggers[name]
+    return _registry.get(name)
 
-        if len(_loggers) >= _MAX_LOGGERS:
-            _loggers.clear()
 
-        new_logger = dLogger(name=name)
+_LAZY = {
+    "ConsoleHandler": ".handlers",
+    "FileHandler": ".handlers",
+    "RingBufferHandler": ".handlers",
+    "NetworkHandler": ".handlers",
+    "RoutingFileHandler": ".handlers",
+    "SimpleFormatter": ".formatters",
+    "ExceptionFormatter": ".formatters",
+    "LevelFilter": ".filters",
+    "KeywordFilter": ".filters",
+    "ModuleFilter": ".filters",
+    "uvicorn_config": ".integrations",
+    "load": ".integrations",
+    "dict_config": ".config",
+    "file_config": ".config",
+    "ConfigWatcher": ".config",
+    "CompatHandler": ".handlers.compat",
+}
 
-        if "." in name:
-            parent_name = name.rsplit(".", 1)[0]
-            if parent_name in _loggers:
-                new_logger._parent = _loggers[parent_name]
-
-        _loggers[name] = new_logger
-        return new_logger
+__getattr__, __dir__ = lazy_loader(__name__, _LAZY)
 
 
 __all__ = [
@@ -51,6 +54,9 @@ __all__ = [
     "Handler",
     "ConsoleHandler",
     "FileHandler",
+    "RingBufferHandler",
+    "NetworkHandler",
+    "RoutingFileHandler",
     "LogRecord",
     "Filter",
     "Formatter",
@@ -62,4 +68,7 @@ __all__ = [
     "CompatHandler",
     "uvicorn_config",
     "load",
+    "dict_config",
+    "file_config",
+    "ConfigWatcher",
 ]
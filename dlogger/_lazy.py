@@ -0,0 +1,31 @@
+
+from typing import Dict
+import importlib
+import sys
+
+def lazy_loader(package: str, names: Dict[str, str]):
+    """
+    build PEP 562 __getattr__/__dir__ that import names from submodules on first access.
+
+    args:
+        package: __name__ of the package
+        names: public name -> relative module that defines it
+
+    returns:
+        (__getattr__, __dir__) for the package namespace
+    """
+    namespace = sys.modules[package].__dict__
+
+    def __getattr__(name: str):
+        module_name = names.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        value = getattr(importlib.import_module(module_name, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(namespace) | set(names))
+
+    return __getattr__, __dir__
@@ -0,0 +1,235 @@
+
+from typing import Optional, Dict, Any
+import importlib
+import threading
+import atexit
+import json
+import os
+
+_lock = threading.RLock()
+_handlers: Dict[str, tuple] = {}
+_configured = set()
+
+def _resolve_class(name: str):
+    if "." in name:
+        module_name, class_name = name.rsplit(".", 1)
+        return getattr(importlib.import_module(module_name), class_name)
+
+    import dlogger
+    return getattr(dlogger, name)
+
+def _build(spec: Dict[str, Any], **extra):
+    spec = dict(spec)
+    cls = _resolve_class(spec.pop("class"))
+    spec.update(extra)
+    return cls(**spec)
+
+def _handler_key(name: str, config: Dict[str, Any]) -> str:
+    spec = config["handlers"][name]
+    return json.dumps({
+        "handler": spec,
+        "formatter": config.get("formatters", {}).get(spec.get("formatter")),
+        "filters": [config.get("filters", {}).get(f) for f in spec.get("filters", [])],
+        "target": _handler_key(spec["target"], config) if isinstance(spec.get("target"), str) else None,
+    }, sort_keys=True, default=str)
+
+def _get_handler(name: str, config: Dict[str, Any], built: Dict[str, Any]):
+    if name in built:
+        return built[name]
+
+    spec = dict(config["handlers"][name])
+    key = _handler_key(name, config)
+
+    previous = _handlers.get(name)
+    if previous and previous[0] == key:
+        built[name] = previous[1]
+        return previous[1]
+
+    extra = {}
+    formatter = spec.pop("formatter", None)
+    if formatter:
+        extra["formatter"] = _build(config["formatters"][formatter])
+    filters = spec.pop("filters", [])
+    if isinstance(spec.get("target"), str):
+        extra["target"] = _get_handler(spec.pop("target"), config, built)
+        extra["close_target"] = False
+
+    handler = _build(spec, **extra)
+    for filter_name in filters:
+        handler.add_filter(_build(config["filters"][filter_name]))
+
+    built[name] = handler
+    return handler
+
+def _close(handler):
+    handler.close()
+    atexit.unregister(handler.close)
+
+def _get_logger(name: str):
+    from dlogger import get_logger
+    return get_logger(None if name == "root" else name)
+
+def dict_config(config: Dict[str, Any]):
+    """
+    configure loggers, handlers, filters and formatters from a dict.
+
+    handlers that did not change since the previous call are reused, so
+    their buffered records are kept; handlers that disappeared are flushed
+    and closed after the new set is installed.
+
+    args:
+        config: dict with "formatters", "filters", "handlers" and "loggers" sections
+    """
+    with _lock:
+        built = {}
+        try:
+            for name in config.get("handlers", {}):
+                _get_handler(name, config, built)
+        except Exception:
+            previous = {id(h) for _, h in _handlers.values()}
+            for handler in built.values():
+                if id(handler) not in previous:
+                    _close(handler)
+            raise
+
+        in_use = {id(h) for h in built.values()}
+        removed = [h for _, h in _handlers.values() if id(h) not in in_use]
+        closing = {id(h) for h in removed}
+
+        loggers = config.get("loggers", {})
+        for name, spec in loggers.items():
+            lgr = _get_logger(name)
+            if "handlers" in spec:
+                lgr.set_handlers([built[h] for h in spec["handlers"]])
+            elif any(id(h) in closing for h in lgr._handlers):
+                # keep handlers set up outside the config, drop the ones about to close
+                lgr.set_handlers([h for h in lgr._handlers if id(h) not in closing])
+            lgr.set_level(spec.get("level", "DEBUG"))
+
+        for name in _configured - set(loggers):
+            _get_logger(name).reset()
+
+        for handler in removed:
+            _close(handler)
+
+        _handlers.clear()
+        for name, handler in built.items():
+            _handlers[name] = (_handler_key(name, config), handler)
+        _configured.clear()
+        _configured.update(loggers)
+
+def _split(value: str) -> list:
+    return [v.strip() for v in value.split(",") if v.strip()]
+
+def _ini_value(value: str):
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+def _parse_ini(path: str) -> Dict[str, Any]:
+    import configparser
+
+    parser = configparser.ConfigParser(interpolation=None)
+    parser.read(path, encoding="utf-8")
+
+    config = {"formatters": {}, "filters": {}, "handlers": {}, "loggers": {}}
+    for kind in ("formatters", "filters", "handlers"):
+        if not parser.has_section(kind):
+            continue
+        for name in _split(parser.get(kind, "keys")):
+            section = dict(parser.items(f"{kind[:-1]}_{name}"))
+            spec = {k: _ini_value(v) if k != "class" else v for k, v in section.items()}
+            if kind == "handlers" and "filters" in section:
+                spec["filters"] = _split(section["filters"])
+            config[kind][name] = spec
+
+    if parser.has_section("loggers"):
+        for name in _split(parser.get("loggers", "keys")):
+            section_name = f"logger_{name}"
+            if not parser.has_section(section_name):
+                continue
+            section = parser[section_name]
+            spec = {"level": section.get("level", "DEBUG")}
+            if "handlers" in section:
+                spec["handlers"] = _split(section["handlers"])
+
+            if section.get("log_file"):
+                handler_name = f"{name}_file"
+                config["handlers"][handler_name] = {
+                    "class": "FileHandler",
+                    "filename": section["log_file"],
+                    "level": spec["level"],
+                    "rotation": section.get("rotation"),
+                    "retention": section.get("retention"),
+                    "compression": section.getboolean("compression", fallback=False),
+                    "time_format": section.get("time_format", "%Y-%m-%d %H:%M:%S"),
+                    "retention_count": section.getint("retention_count", fallback=None),
+                    "retention_size": section.get("retention_size"),
+                }
+                spec["handlers"] = spec.get("handlers", []) + [handler_name]
+            config["loggers"][name] = spec
+
+    return config
+
+def file_config(path: str, watch: bool = False, interval: float = 1.0) -> Optional["ConfigWatcher"]:
+    """
+    configure dlogger from an INI or JSON file.
+
+    args:
+        path: path to .ini/.conf or .json config
+        watch: reload the file in the background when it changes
+        interval: polling interval in seconds
+
+    returns:
+        ConfigWatcher if watch is True, else None
+
+    raises:
+        FileNotFoundError: if config file does not exist
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Config file not found: {path}")
+
+    if path.endswith(".json"):
+        with open(path, "r", encoding="utf-8") as f:
+            dict_config(json.load(f))
+    else:
+        dict_config(_parse_ini(path))
+
+    if watch:
+        return ConfigWatcher(path, interval)
+    return None
+
+class ConfigWatcher:
+    """polls a config file's mtime and reapplies it when it changes."""
+
+    def __init__(self, path: str, interval: float = 1.0):
+        self._path = path
+        self._interval = interval
+        self._stop = threading.Event()
+        self._stamp = self._get_stamp()
+        self._thread = threading.Thread(target=self._run, name="dlogger-config", daemon=True)
+        self._thread.start()
+
+    def _get_stamp(self):
+        try:
+            stat = os.stat(self._path)
+            return (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return None
+
+    def _run(self):
+        while not self._stop.wait(self._interval):
+            stamp = self._get_stamp()
+            if stamp is None or stamp == self._stamp:
+                continue
+            self._stamp = stamp
+            try:
+                file_config(self._path)
+            except Exception as e:
+                print(f"⚠️ Error reloading config: {e}")
+
+    def stop(self):
+        """stop watching the file."""
+        self._stop.set()
+        self._thread.join()
@@ -1,6 +1,13 @@
 from ..handlers.base import Filter
-from .level import LevelFilter
-from .keyword import KeywordFilter
-from .module import ModuleFilter
+from .._lazy import lazy_loader
+
+_LAZY = {
+    "LevelFilter": ".level",
+    "KeywordFilter": ".keyword",
+    "ModuleFilter": ".module",
+}
+
+__getattr__, __dir__ = lazy_loader(__name__, _LAZY)
+
 
 __all__ = ["Filter", "LevelFilter", "KeywordFilter", "ModuleFilter"]
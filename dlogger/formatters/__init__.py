@@ -1,5 +1,12 @@
 from ..handlers.base import Formatter
-from .simple import SimpleFormatter
-from .exception import ExceptionFormatter
+from .._lazy import lazy_loader
+
+_LAZY = {
+    "SimpleFormatter": ".simple",
+    "ExceptionFormatter": ".exception",
+}
+
+__getattr__, __dir__ = lazy_loader(__name__, _LAZY)
+
 
 __all__ = ["Formatter", "SimpleFormatter", "ExceptionFormatter"]
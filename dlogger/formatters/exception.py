@@ -1,19 +1,58 @@
 
+from collections import OrderedDict
+from typing import Optional
+import threading
+import builtins
 import sys
 import traceback
-from typing import Optional
 
 from ..handlers.base import Formatter
 
+_CAUSE_HEADER = "\nThe above exception was the direct cause of the following exception:\n\n"
+_CONTEXT_HEADER = "\nDuring handling of the above exception, another exception occurred:\n\n"
+_GROUP_TYPE = getattr(builtins, "BaseExceptionGroup", None)
+
 class ExceptionFormatter(Formatter):
     """formatter that formats exceptions with traceback."""
 
+    max_frames: Optional[int] = 50
+    max_line_length: Optional[int] = 1000
+    max_chain_depth: int = 5
+    cache_size: int = 256
+
+    _cache = OrderedDict()
+    _cache_lock = threading.Lock()
+
     def format(self, record: "handlers.LogRecord") -> str:
         """format a log record with exception traceback."""
         raise NotImplementedError
 
-    @staticmethod
-    def format_exception(exc: Optional[BaseException]) -> str:
+    @classmethod
+    def configure(
+        cls,
+        max_frames: Optional[int] = 50,
+        max_line_length: Optional[int] = 1000,
+        max_chain_depth: int = 5,
+        cache_size: int = 256,
+    ):
+        """
+        configure traceback rendering limits.
+
+        args:
+            max_frames: keep only the innermost frames of each traceback (None - no limit)
+            max_line_length: truncate longer traceback lines (None - no limit)
+            max_chain_depth: how many chained exceptions (__cause__/__context__) to render
+            cache_size: how many rendered stacks to keep
+        """
+        cls.max_frames = max_frames
+        cls.max_line_length = max_line_length
+        cls.max_chain_depth = max_chain_depth
+        cls.cache_size = cache_size
+        with cls._cache_lock:
+            cls._cache.clear()
+
+    @classmethod
+    def format_exception(cls, exc: Optional[BaseException]) -> str:
         """
         format exception with full traceback.
 
@@ -23,9 +62,108 @@ class ExceptionFormatter(Formatter):
         returns:
             formatted traceback string
         """
-        if exc:
-            return ''.join(traceback.format_exception(type(exc), exc, exc.__traceback__))
-        return ""
+        if not exc:
+            return ""
+        return cls._format_chain(exc, 0)
+
+    @classmethod
+    def _format_chain(cls, exc: BaseException, depth: int) -> str:
+        chain = []
+        seen = set()
+        current = exc
+        while current is not None and id(current) not in seen and len(chain) < cls.max_chain_depth:
+            seen.add(id(current))
+            if current.__cause__ is not None:
+                chain.append((current, _CAUSE_HEADER))
+                current = current.__cause__
+            elif current.__context__ is not None and not current.__suppress_context__:
+                chain.append((current, _CONTEXT_HEADER))
+                current = current.__context__
+            else:
+                chain.append((current, ""))
+                current = None
+
+        parts = []
+        for i, (item, header) in enumerate(reversed(chain)):
+            if i and header:
+                parts.append(header)
+            parts.append(cls._format_single(item))
+            if _GROUP_TYPE is not None and isinstance(item, _GROUP_TYPE):
+                parts.append(cls._format_group(item, depth + 1))
+
+        if current is not None:
+            parts.insert(0, "... chained exceptions omitted ...\n\n")
+        return "".join(parts)
+
+    @classmethod
+    def _format_single(cls, exc: BaseException) -> str:
+        tail = "".join(traceback.format_exception_only(type(exc), exc))
+        tb = exc.__traceback__
+        if tb is None:
+            return cls._truncate(tail)
+
+        fingerprint = []
+        while tb is not None:
+            code = tb.tb_frame.f_code
+            # tb_lasti tells apart subexpressions on one line, which get their own markers
+            fingerprint.append((code.co_filename, code.co_name, tb.tb_lineno, tb.tb_lasti))
+            tb = tb.tb_next
+        key = (type(exc), tuple(fingerprint))
+
+        with cls._cache_lock:
+            stack = cls._cache.get(key)
+            if stack is not None:
+                cls._cache.move_to_end(key)
+
+        if stack is None:
+            stack = cls._render_stack(exc)
+            with cls._cache_lock:
+                cls._cache[key] = stack
+                if len(cls._cache) > cls.cache_size:
+                    cls._cache.popitem(last=False)
+
+        return stack + cls._truncate(tail)
+
+    @classmethod
+    def _format_group(cls, group: BaseException, depth: int) -> str:
+        """render the sub-exceptions of an exception group, nested up to max_chain_depth."""
+        if depth >= cls.max_chain_depth:
+            return "  | ... sub-exceptions omitted ...\n"
+
+        parts = []
+        for i, sub in enumerate(group.exceptions, 1):
+            parts.append(f"  +---------------- {i} ----------------\n")
+            body = cls._format_chain(sub, depth)
+            parts.extend(f"  | {line}" for line in body.splitlines(keepends=True))
+        parts.append("  +------------------------------------\n")
+        return "".join(parts)
+
+    @classmethod
+    def _render_stack(cls, exc: BaseException) -> str:
+        frames = traceback.extract_tb(exc.__traceback__)
+        omitted = 0
+        if cls.max_frames is not None and len(frames) > cls.max_frames:
+            omitted = len(frames) - cls.max_frames
+            frames = frames[omitted:] if cls.max_frames else []
+
+        lines = ["Traceback (most recent call last):\n"]
+        if omitted:
+            lines.append(f"  ... {omitted} frames omitted ...\n")
+        lines.extend(traceback.format_list(frames))
+        return cls._truncate("".join(lines))
+
+    @classmethod
+    def _truncate(cls, text: str) -> str:
+        limit = cls.max_line_length
+        if limit is None:
+            return text
+        lines = text.splitlines(keepends=True)
+        if all(len(line) <= limit for line in lines):
+            return text
+        return "".join(
+            line if len(line) <= limit else f"{line[:limit].rstrip()}...\n"
+            for line in lines
+        )
 
     @staticmethod
     def get_current_exception() -> Optional[BaseException]:
@@ -1,5 +1,15 @@
 from .base import Handler, Formatter, LogRecord, Filter
-from .console import ConsoleHandler
-from .file import FileHandler
+from .._lazy import lazy_loader
 
-__all__ = ["Handler", "Formatter", "LogRecord", "Filter", "ConsoleHandler", "FileHandler"]
+_LAZY = {
+    "ConsoleHandler": ".console",
+    "FileHandler": ".file",
+    "RingBufferHandler": ".ring",
+    "NetworkHandler": ".network",
+    "RoutingFileHandler": ".routing",
+}
+
+__getattr__, __dir__ = lazy_loader(__name__, _LAZY)
+
+
+__all__ = ["Handler", "Formatter", "LogRecord", "Filter", "ConsoleHandler", "FileHandler", "RingBufferHandler", "NetworkHandler", "RoutingFileHandler"]
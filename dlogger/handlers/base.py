@@ -21,13 +21,32 @@ class LogRecord:
         context: str,
         timestamp: datetime,
         color: Optional[str] = None,
+        exc: Optional[BaseException] = None,
+        extra: Optional[dict] = None,
     ):
         self.level = level
         self.level_value = level_value
-        self.message = message
+        self._message = message
         self.context = context
         self.timestamp = timestamp
         self.color = color
+        self.exc = exc
+        self.extra = extra or {}
+        self._rendered = exc is None
+
+    @property
+    def message(self) -> str:
+        """message text, with the traceback rendered on first access."""
+        if not self._rendered:
+            from ..formatters.exception import ExceptionFormatter
+            self._message = f"{self._message}\n{ExceptionFormatter.format_exception(self.exc)}"
+            self._rendered = True
+        return self._message
+
+    @message.setter
+    def message(self, value: str):
+        self._message = value
+        self._rendered = True
 
 class Filter(ABC):
     """base filter interface."""
@@ -93,6 +112,10 @@ class Handler(ABC):
         """emit a log record. Must be implemented by subclasses."""
         raise NotImplementedError
 
+    def flush(self):
+        """write out any buffered records."""
+        pass
+
     def close(self):
         """close the handler and release resources."""
         pass
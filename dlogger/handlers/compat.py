@@ -27,6 +27,6 @@ class CompatHandler(logging.Handler):
         context = f"{record.name}:{record.module}:{record.funcName}:"
 
         if record.exc_info:
-            self._dlogger.exception(msg, context=context)
+            self._dlogger.exception(msg, exc=record.exc_info[1], context=context)
         else:
             getattr(self._dlogger, level_name)(msg, context=context)
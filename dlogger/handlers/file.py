@@ -1,12 +1,13 @@
 
 from typing import Optional, Literal
-from datetime import datetime, timedelta
+from datetime import datetime
 import threading
 import atexit
 import gzip
 import os
 
 from .base import Handler, LogRecord, Formatter
+from .retention import SegmentManifest, get_scheduler
 
 class FileHandler(Handler):
     """handler that writes log records to a file with rotation and compression support."""
@@ -21,12 +22,17 @@ class FileHandler(Handler):
         compression: bool = False,
         buffer_size: int = 100,
         time_format: str = "%Y-%m-%d %H:%M:%S",
+        retention_count: Optional[int] = None,
+        retention_size: Optional[str] = None,
     ):
         super().__init__(level=level, formatter=formatter)
         self._filename = filename
         self._rotation_size = None
         self._rotation_time = None
         self._retention_days = None
+        self._retention_count = retention_count
+        self._retention_size = None
+        self._manifest = None
         self._compression = compression
         self._current_file_creation = None
         self._time_format = time_format
@@ -36,6 +42,7 @@ class FileHandler(Handler):
         self._buffer_size = buffer_size
         self._log_count = 0
         self._check_rotation_every = 100
+        self._closed = False
 
         self._ensure_log_directory()
 
@@ -45,23 +52,30 @@ class FileHandler(Handler):
         if retention:
             self._retention_days = self._parse_retention(retention)
 
-        if self._retention_days:
+        if retention_size:
+            self._retention_size = self._parse_size(retention_size)
+
+        if self._retention_days or self._retention_count is not None or self._retention_size:
+            self._manifest = SegmentManifest(
+                filename,
+                max_age=self._retention_days * 86400 if self._retention_days else None,
+                max_count=self._retention_count,
+                max_bytes=self._retention_size,
+            )
+            get_scheduler().register(self._manifest)
             self._cleanup_old_logs()
 
         atexit.register(self.close)
 
+    @property
+    def filename(self) -> str:
+        return self._filename
+
     def _parse_rotation(self, rotation: str):
         rotation = rotation.strip().lower()
 
         if "kb" in rotation or "mb" in rotation or "gb" in rotation:
-            value = float(rotation.replace("kb", "").replace("mb", "").replace("gb", "").strip())
-
-            if "kb" in rotation:
-                self._rotation_size = int(value * 1024)
-            elif "mb" in rotation:
-                self._rotation_size = int(value * 1024 * 1024)
-            elif "gb" in rotation:
-                self._rotation_size = int(value * 1024 * 1024 * 1024)
+            self._rotation_size = self._parse_size(rotation)
 
         elif "hour" in rotation or "day" in rotation or "week" in rotation:
             parts = rotation.split()
@@ -75,6 +89,18 @@ class FileHandler(Handler):
             elif "week" in unit:
                 self._rotation_time = value * 604800
 
+    def _parse_size(self, size: str) -> int:
+        size = size.strip().lower()
+        value = float(size.replace("kb", "").replace("mb", "").replace("gb", "").strip())
+
+        if "kb" in size:
+            return int(value * 1024)
+        elif "mb" in size:
+            return int(value * 1024 * 1024)
+        elif "gb" in size:
+            return int(value * 1024 * 1024 * 1024)
+        return int(value)
+
     def _parse_retention(self, retention: str) -> int:
         retention = retention.strip().lower()
         parts = retention.split()
@@ -117,55 +143,44 @@ class FileHandler(Handler):
             return
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        rotated_name = f"{self._filename}.{timestamp}"
+        if self._manifest:
+            rotated_name = self._manifest.next_name(timestamp)
+        else:
+            rotated_name = f"{self._filename}.{timestamp}"
+            counter = 0
+            while os.path.exists(rotated_name) or os.path.exists(f"{rotated_name}.gz"):
+                counter += 1
+                rotated_name = f"{self._filename}.{timestamp}_{counter}"
 
         try:
             os.rename(self._filename, rotated_name)
 
             if self._compression:
-                self._compress_file(rotated_name)
+                rotated_name = self._compress_file(rotated_name)
 
             self._current_file_creation = datetime.now()
 
-            if self._retention_days:
+            if self._manifest:
+                self._manifest.add(rotated_name)
                 self._cleanup_old_logs()
         except Exception as e:
             print(f"⚠️ Error during log rotation: {e}")
 
-    def _compress_file(self, filepath: str):
+    def _compress_file(self, filepath: str) -> str:
         try:
             with open(filepath, 'rb') as f_in:
                 with gzip.open(f"{filepath}.gz", 'wb') as f_out:
                     f_out.writelines(f_in)
             os.remove(filepath)
+            return f"{filepath}.gz"
         except Exception as e:
             print(f"⚠️ Error during file compression: {e}")
+            return filepath
 
     def _cleanup_old_logs(self):
-        if not self._retention_days:
-            return
-
-        try:
-            log_dir = os.path.dirname(self._filename) or "."
-            base_name = os.path.basename(self._filename)
-
-            cutoff_date = datetime.now() - timedelta(days=self._retention_days)
-
-            for filename in os.listdir(log_dir):
-                if not filename.startswith(base_name):
-                    continue
-
-                if filename == base_name:
-                    continue
-
-                filepath = os.path.join(log_dir, filename)
-
-                if os.path.isfile(filepath):
-                    file_mtime = datetime.fromtimestamp(os.path.getmtime(filepath))
-                    if file_mtime < cutoff_date:
-                        os.remove(filepath)
-        except Exception as e:
-            print(f"⚠️ Error during log cleanup: {e}")
+        """hand retention over to the background scheduler."""
+        if self._manifest:
+            get_scheduler().wake()
 
     def _flush_buffer(self):
         if not self._buffer:
@@ -194,7 +209,7 @@ class FileHandler(Handler):
         with self._lock:
             self._buffer.append(log_line)
 
-            if len(self._buffer) >= self._buffer_size:
+            if len(self._buffer) >= self._buffer_size or self._closed:
                 self._flush_buffer()
 
             self._log_count += 1
@@ -204,6 +219,15 @@ class FileHandler(Handler):
                     self._flush_buffer()
                     self._rotate_log()
 
+    def flush(self):
+        """write buffered records to the file."""
+        with self._lock:
+            self._flush_buffer()
+
     def close(self):
-        """flush buffer and close the handler."""
-        self._flush_buffer()
+        """flush buffer and close the handler; later records are written directly."""
+        with self._lock:
+            self._closed = True
+            self._flush_buffer()
+        if self._manifest:
+            get_scheduler().unregister(self._manifest)
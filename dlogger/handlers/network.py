@@ -0,0 +1,305 @@
+
+from collections import deque
+from typing import Optional, Literal, Union, Tuple, List
+import threading
+import atexit
+import shutil
+import copy
+import socket
+import struct
+import json
+import time
+import os
+
+from .base import Handler, LogRecord, Formatter
+
+class NetworkHandler(Handler):
+    """handler that ships log records to a collector from a background thread."""
+
+    SEVERITIES = {
+        "TRACE": 7,
+        "DEBUG": 7,
+        "INFO": 6,
+        "SUCCESS": 5,
+        "WARNING": 4,
+        "ERROR": 3,
+        "CRITICAL": 2,
+    }
+
+    def __init__(
+        self,
+        address: Union[Tuple[str, int], str],
+        protocol: Literal["tcp", "udp", "unix", "unixgram"] = "tcp",
+        format: Literal["syslog", "ndjson"] = "ndjson",
+        level: str = "TRACE",
+        formatter: Optional[Formatter] = None,
+        app_name: str = "dlogger",
+        facility: int = 1,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        max_queue: int = 10000,
+        spill_file: Optional[str] = None,
+        max_spill_size: int = 100 * 1024 * 1024,
+        timeout: float = 5.0,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+    ):
+        super().__init__(level=level, formatter=formatter)
+        self._address = address
+        self._protocol = protocol
+        self._datagram = protocol in ("udp", "unixgram")
+        self._format = format
+        self._app_name = app_name
+        self._facility = facility
+        self._hostname = socket.gethostname()
+        self._pid = os.getpid()
+
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._spill_file = spill_file
+        self._max_spill_size = max_spill_size
+        self._timeout = timeout
+        self._backoff = backoff
+        self._max_backoff = max_backoff
+
+        self._queue = deque(maxlen=max_queue)
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._socket = None
+        self._retry_at = 0.0
+        self._retry_delay = backoff
+        self._dropped = 0
+
+        self._thread = threading.Thread(target=self._run, name="dlogger-network", daemon=True)
+        self._thread.start()
+
+        atexit.register(self.close)
+
+    @property
+    def dropped(self) -> int:
+        """number of records lost because the queue or spill file was full."""
+        return self._dropped
+
+    def emit(self, record: LogRecord):
+        """queue a log record for shipping."""
+        if not self._should_log(record):
+            return
+
+        if record.exc is not None:
+            # render now and queue a copy so the traceback's frames are not kept alive
+            message = record.message
+            record = copy.copy(record)
+            record.exc = None
+            record.message = message
+
+        with self._lock:
+            if len(self._queue) == self._queue.maxlen:
+                self._dropped += 1
+            self._queue.append(record)
+            if len(self._queue) >= self._batch_size:
+                self._wake.set()
+
+    def _encode(self, record: LogRecord) -> bytes:
+        if self._formatter:
+            message = self._formatter.format(record)
+        else:
+            message = f"{record.context} {record.message}"
+
+        if self._format == "syslog":
+            pri = self._facility * 8 + self.SEVERITIES.get(record.level, 6)
+            timestamp = record.timestamp.astimezone().isoformat()
+            return f"<{pri}>1 {timestamp} {self._hostname} {self._app_name} {self._pid} {record.level} - {message}".encode("utf-8")
+
+        return json.dumps({
+            "timestamp": record.timestamp.astimezone().isoformat(),
+            "level": record.level,
+            "context": record.context,
+            "message": message if self._formatter else record.message,
+            "host": self._hostname,
+            "app": self._app_name,
+        }, ensure_ascii=False).encode("utf-8")
+
+    def _frame(self, payload: bytes) -> bytes:
+        if self._datagram:
+            return payload
+        if self._format == "syslog":
+            return f"{len(payload)} ".encode("ascii") + payload
+        return struct.pack(">I", len(payload)) + payload
+
+    def _connect(self):
+        if self._protocol == "unix":
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        elif self._protocol == "unixgram":
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        elif self._protocol == "udp":
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        else:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.settimeout(self._timeout)
+        try:
+            sock.connect(self._address)
+        except Exception:
+            sock.close()
+            raise
+        self._socket = sock
+
+    def _disconnect(self):
+        if self._socket is not None:
+            try:
+                self._socket.close()
+            except OSError:
+                pass
+            self._socket = None
+
+    def _ensure_connected(self) -> bool:
+        if self._socket is not None:
+            return True
+        if time.monotonic() < self._retry_at:
+            return False
+        try:
+            self._connect()
+        except OSError:
+            self._retry_at = time.monotonic() + self._retry_delay
+            self._retry_delay = min(self._retry_delay * 2, self._max_backoff)
+            return False
+        return True
+
+    def _send(self, payloads: List[bytes]) -> bool:
+        """send payloads over the persistent connection, reconnecting with backoff."""
+        if not self._ensure_connected():
+            return False
+
+        try:
+            if self._datagram:
+                for payload in payloads:
+                    self._socket.send(payload)
+            else:
+                self._socket.sendall(b"".join(self._frame(p) for p in payloads))
+        except OSError:
+            self._disconnect()
+            self._retry_at = time.monotonic() + self._retry_delay
+            self._retry_delay = min(self._retry_delay * 2, self._max_backoff)
+            return False
+
+        self._retry_delay = self._backoff
+        return True
+
+    def _spill(self, payloads: List[bytes]):
+        try:
+            size = os.path.getsize(self._spill_file) if os.path.exists(self._spill_file) else 0
+            with open(self._spill_file, "ab") as f:
+                for payload in payloads:
+                    if size + len(payload) + 4 > self._max_spill_size:
+                        self._dropped += 1
+                        continue
+                    f.write(struct.pack(">I", len(payload)) + payload)
+                    size += len(payload) + 4
+        except Exception as e:
+            self._dropped += len(payloads)
+            print(f"⚠️ Error writing spill file: {e}")
+
+    def _replay(self) -> bool:
+        """resend records spilled to disk while the collector was unreachable."""
+        if not self._spill_file or not os.path.exists(self._spill_file):
+            return True
+        if not self._ensure_connected():
+            return False
+
+        failed_at = None
+        try:
+            with open(self._spill_file, "rb") as f:
+                while True:
+                    offset = f.tell()
+                    payloads = self._read_frames(f, self._batch_size)
+                    if not payloads:
+                        break
+                    if not self._send(payloads):
+                        failed_at = offset
+                        break
+
+            if failed_at is None:
+                os.remove(self._spill_file)
+                return True
+            self._truncate_spill(failed_at)
+        except Exception as e:
+            print(f"⚠️ Error reading spill file: {e}")
+            return True
+        return False
+
+    @staticmethod
+    def _read_frames(f, count: int) -> List[bytes]:
+        """read up to count length-prefixed payloads from the spill file."""
+        payloads = []
+        while len(payloads) < count:
+            header = f.read(4)
+            if len(header) < 4:
+                break
+            (length,) = struct.unpack(">I", header)
+            payload = f.read(length)
+            if len(payload) < length:
+                break
+            payloads.append(payload)
+        return payloads
+
+    def _truncate_spill(self, offset: int):
+        """drop the already replayed head of the spill file."""
+        tmp_path = f"{self._spill_file}.tmp"
+        with open(self._spill_file, "rb") as f_in, open(tmp_path, "wb") as f_out:
+            f_in.seek(offset)
+            shutil.copyfileobj(f_in, f_out)
+        os.replace(tmp_path, self._spill_file)
+
+    def _drain(self) -> List[LogRecord]:
+        with self._lock:
+            count = min(len(self._queue), self._batch_size)
+            return [self._queue.popleft() for _ in range(count)]
+
+    def _requeue(self, records: List[LogRecord]):
+        with self._lock:
+            space = self._queue.maxlen - len(self._queue)
+            if space < len(records):
+                self._dropped += len(records) - space
+                records = records[len(records) - space:] if space else []
+            self._queue.extendleft(reversed(records))
+
+    def _flush(self):
+        connected = self._replay()
+        while True:
+            records = self._drain()
+            if not records:
+                return
+
+            payloads = [self._encode(r) for r in records]
+            if connected and self._send(payloads):
+                continue
+
+            connected = False
+            if not self._spill_file:
+                self._requeue(records)
+                return
+            self._spill(payloads)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait(self._flush_interval)
+            self._wake.clear()
+            try:
+                self._flush()
+            except Exception as e:
+                print(f"⚠️ Network handler error: {e}")
+
+        # the final flush stays on this thread so the socket never has two writers
+        try:
+            self._flush()
+        except Exception as e:
+            print(f"⚠️ Network handler error: {e}")
+        self._disconnect()
+
+    def close(self):
+        """ship queued records and close the connection."""
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        self._wake.set()
+        self._thread.join(self._timeout)
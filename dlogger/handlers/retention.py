@@ -0,0 +1,248 @@
+
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional, List, Tuple
+import threading
+import weakref
+import json
+import time
+import re
+import os
+
+class SegmentManifest:
+    """tracks rotated segments of a single log file and enforces retention.
+
+    the manifest file is an append-only journal of added ("+") and removed ("-")
+    segments, compacted once removals outnumber live entries.
+    """
+
+    _NAME_RE = r"^{base}\.(\d{{8}}_\d{{6}})(?:_(\d+))?(\.gz)?$"
+    _COMPACT_MIN = 64
+
+    def __init__(
+        self,
+        filename: str,
+        max_age: Optional[float] = None,
+        max_count: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ):
+        self._filename = filename
+        self._path = f"{filename}.manifest"
+        self._max_age = max_age
+        self._max_count = max_count
+        self._max_bytes = max_bytes
+        self._pattern = re.compile(self._NAME_RE.format(base=re.escape(os.path.basename(filename))))
+
+        self._lock = threading.Lock()
+        self._segments = OrderedDict()
+        self._total_bytes = 0
+        self._journal_lines = 0
+        self._last_name = ("", -1)
+
+        self._load()
+
+    @property
+    def segments(self) -> List[Tuple[str, float, int]]:
+        with self._lock:
+            return [(path, created, size) for path, (created, size) in self._segments.items()]
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def next_name(self, timestamp: str) -> str:
+        """return an unused rotated name for timestamp, never reusing an issued counter."""
+        with self._lock:
+            last_timestamp, last_counter = self._last_name
+            counter = last_counter + 1 if timestamp == last_timestamp else 0
+            while True:
+                name = f"{self._filename}.{timestamp}" if counter == 0 else f"{self._filename}.{timestamp}_{counter}"
+                if not os.path.exists(name) and not os.path.exists(f"{name}.gz"):
+                    break
+                counter += 1
+            self._last_name = (timestamp, counter)
+            return name
+
+    def add(self, path: str, created: Optional[float] = None):
+        """register a freshly rotated (or compressed) segment."""
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            size = 0
+
+        with self._lock:
+            entry = (created or time.time(), size)
+            lines = []
+            if path in self._segments:
+                self._total_bytes -= self._segments.pop(path)[1]
+                lines.append(["-", path])
+            self._segments[path] = entry
+            self._total_bytes += size
+            self._remember_name(path)
+            lines.append(["+", path, entry[0], size])
+            self._append(lines)
+
+    def enforce(self):
+        """delete expired segments, oldest first, until every limit is met."""
+        expired = []
+        cutoff = time.time() - self._max_age if self._max_age else None
+
+        with self._lock:
+            while self._segments:
+                path, (created, size) = next(iter(self._segments.items()))
+                if (
+                    (cutoff is not None and created < cutoff)
+                    or (self._max_count is not None and len(self._segments) > self._max_count)
+                    or (self._max_bytes is not None and self._total_bytes > self._max_bytes)
+                ):
+                    self._segments.popitem(last=False)
+                    self._total_bytes -= size
+                    expired.append(path)
+                else:
+                    break
+
+            if expired:
+                self._append([["-", path] for path in expired])
+
+        for path in expired:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                print(f"⚠️ Error during log cleanup: {e}")
+
+    def _remember_name(self, path: str):
+        match = self._pattern.match(os.path.basename(path))
+        if match:
+            name = (match.group(1), int(match.group(2) or 0))
+            if name > self._last_name:
+                self._last_name = name
+
+    def _load(self):
+        try:
+            with open(self._path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    entry = json.loads(line)
+                    self._journal_lines += 1
+                    if entry[0] == "+":
+                        _, path, created, size = entry
+                        if path in self._segments:
+                            self._total_bytes -= self._segments.pop(path)[1]
+                        self._segments[path] = (created, size)
+                        self._total_bytes += size
+                        self._remember_name(path)
+                    elif entry[1] in self._segments:
+                        self._total_bytes -= self._segments.pop(entry[1])[1]
+        except FileNotFoundError:
+            self._bootstrap()
+        except Exception as e:
+            print(f"⚠️ Error reading log manifest: {e}")
+            self._segments.clear()
+            self._total_bytes = 0
+            self._bootstrap()
+
+    def _bootstrap(self):
+        """build the manifest once from segments already on disk."""
+        log_dir = os.path.dirname(self._filename) or "."
+        found = []
+
+        try:
+            with os.scandir(log_dir) as entries:
+                for entry in entries:
+                    match = self._pattern.match(entry.name)
+                    if not match or not entry.is_file():
+                        continue
+                    created = datetime.strptime(match.group(1), "%Y%m%d_%H%M%S").timestamp()
+                    counter = int(match.group(2) or 0)
+                    path = os.path.join(os.path.dirname(self._filename), entry.name)
+                    found.append((created, counter, path, entry.stat().st_size))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"⚠️ Error during log cleanup: {e}")
+
+        found.sort()
+        for created, _, path, size in found:
+            self._segments[path] = (created, size)
+            self._total_bytes += size
+            self._remember_name(path)
+
+        with self._lock:
+            self._compact()
+
+    def _append(self, lines: list):
+        self._journal_lines += len(lines)
+        if self._journal_lines > max(self._COMPACT_MIN, 2 * len(self._segments)):
+            self._compact()
+            return
+
+        try:
+            with open(self._path, "a", encoding="utf-8") as f:
+                f.writelines(json.dumps(line) + "\n" for line in lines)
+        except Exception as e:
+            print(f"⚠️ Error writing log manifest: {e}")
+
+    def _compact(self):
+        """rewrite the journal with only the live segments."""
+        tmp_path = f"{self._path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.writelines(
+                    json.dumps(["+", path, created, size]) + "\n"
+                    for path, (created, size) in self._segments.items()
+                )
+            os.replace(tmp_path, self._path)
+            self._journal_lines = len(self._segments)
+        except Exception as e:
+            print(f"⚠️ Error writing log manifest: {e}")
+
+class RetentionScheduler:
+    """background thread that periodically enforces retention for registered manifests."""
+
+    def __init__(self, interval: float = 60.0):
+        self._interval = interval
+        self._manifests = weakref.WeakSet()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+
+    def register(self, manifest: SegmentManifest):
+        with self._lock:
+            self._manifests.add(manifest)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="dlogger-retention", daemon=True)
+                self._thread.start()
+
+    def unregister(self, manifest: SegmentManifest):
+        with self._lock:
+            self._manifests.discard(manifest)
+
+    def wake(self):
+        """run a retention pass as soon as possible."""
+        self._wake.set()
+
+    def _run(self):
+        while True:
+            self._wake.wait(self._interval)
+            self._wake.clear()
+
+            with self._lock:
+                manifests = list(self._manifests)
+
+            for manifest in manifests:
+                manifest.enforce()
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+def get_scheduler() -> RetentionScheduler:
+    """return the shared retention scheduler."""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = RetentionScheduler()
+    return _scheduler
@@ -0,0 +1,126 @@
+
+from typing import Optional, List, Literal
+import threading
+import weakref
+
+from .base import Handler, LogRecord, Formatter
+
+class _Ring:
+    """fixed-size circular buffer of raw log records."""
+
+    __slots__ = ("_records", "_index", "_capacity")
+
+    def __init__(self, capacity: int):
+        self._records: List[Optional[LogRecord]] = [None] * capacity
+        self._index = 0
+        self._capacity = capacity
+
+    def append(self, record: LogRecord):
+        self._records[self._index] = record
+        self._index = (self._index + 1) % self._capacity
+
+    def drain(self) -> List[LogRecord]:
+        """return buffered records oldest first and empty the ring."""
+        records = self._records[self._index:] + self._records[:self._index]
+        for i in range(self._capacity):
+            self._records[i] = None
+        self._index = 0
+        return [r for r in records if r is not None]
+
+class RingBufferHandler(Handler):
+    """handler that keeps the last records in memory and dumps them to a target handler on error."""
+
+    def __init__(
+        self,
+        target: Handler,
+        capacity: int = 1000,
+        trigger_level: str = "ERROR",
+        level: str = "TRACE",
+        formatter: Optional[Formatter] = None,
+        scope: Literal["global", "thread", "context"] = "global",
+        close_target: bool = True,
+    ):
+        super().__init__(level=level, formatter=formatter)
+        from dlogger.logger import dLogger
+        self._target = target
+        self._capacity = capacity
+        self._trigger_level = dLogger.LEVELS.get(trigger_level.upper(), (40,))[0]
+        self._scope = scope
+        self._close_target = close_target
+
+        self._lock = threading.Lock()
+        self._ring = _Ring(capacity) if scope == "global" else None
+        self._local = threading.local()
+        self._task_rings = weakref.WeakKeyDictionary()
+        if scope == "context":
+            import asyncio
+            self._current_task = asyncio.current_task
+
+    @property
+    def target(self) -> Handler:
+        return self._target
+
+    def _get_ring(self) -> _Ring:
+        if self._scope == "context":
+            try:
+                task = self._current_task()
+            except RuntimeError:
+                task = None
+
+            if task is not None:
+                ring = self._task_rings.get(task)
+                if ring is None:
+                    with self._lock:
+                        ring = self._task_rings.setdefault(task, _Ring(self._capacity))
+                return ring
+
+        if self._scope != "global":
+            ring = getattr(self._local, "ring", None)
+            if ring is None:
+                ring = self._local.ring = _Ring(self._capacity)
+            return ring
+
+        return self._ring
+
+    def emit(self, record: LogRecord):
+        """buffer a log record, flushing the window if it reaches the trigger level."""
+        if not self._should_log(record):
+            return
+
+        ring = self._get_ring()
+
+        if record.level_value < self._trigger_level and record.exc is None:
+            if self._scope == "global":
+                with self._lock:
+                    ring.append(record)
+            else:
+                ring.append(record)
+            return
+
+        if self._scope == "global":
+            with self._lock:
+                records = ring.drain()
+        else:
+            records = ring.drain()
+
+        for buffered in records:
+            self._target.emit(buffered)
+        self._target.emit(record)
+
+    def flush(self):
+        """dump the current window to the target handler without a trigger."""
+        if self._scope == "global":
+            with self._lock:
+                records = self._ring.drain()
+        else:
+            records = self._get_ring().drain()
+
+        for buffered in records:
+            self._target.emit(buffered)
+
+    def close(self):
+        """close the target handler, or flush it if it is shared with others."""
+        if self._close_target:
+            self._target.close()
+        else:
+            self._target.flush()
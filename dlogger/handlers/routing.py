@@ -0,0 +1,196 @@
+
+from collections import OrderedDict
+from typing import Optional, Dict
+import threading
+import string
+import atexit
+import os
+
+from .base import Handler, LogRecord, Formatter
+from .file import FileHandler
+
+class _Fields(dict):
+    """template fields with path-safe values and "unknown" for missing keys."""
+
+    def __missing__(self, key: str) -> str:
+        return "unknown"
+
+    def __getitem__(self, key: str) -> str:
+        value = str(super().__getitem__(key)) if key in self else self.__missing__(key)
+        value = value.replace("/", "_").replace(os.sep, "_")
+        return "_" if value in ("", ".", "..") else value
+
+class _Destination(FileHandler):
+    """file handler whose writes go through the router's shared pool of open files."""
+
+    def __init__(self, router: "RoutingFileHandler", filename: str, **kwargs):
+        self._router = router
+        self._touched = False
+        super().__init__(filename, **kwargs)
+        atexit.unregister(self.close)
+
+    def _flush_buffer(self):
+        if not self._buffer:
+            return
+
+        buffer_to_write = self._buffer
+        self._buffer = []
+
+        try:
+            self._router._write(self._filename, buffer_to_write)
+        except Exception as e:
+            print(f"⚠️ Buffer write error: {e}")
+            self._buffer = buffer_to_write + self._buffer
+
+    def _rotate_log(self):
+        self._router._release(self._filename)
+        super()._rotate_log()
+
+    def close(self):
+        super().close()
+        self._router._release(self._filename)
+
+class RoutingFileHandler(Handler):
+    """handler that routes records to one file per destination built from a path template."""
+
+    def __init__(
+        self,
+        template: str,
+        level: str = "TRACE",
+        formatter: Optional[Formatter] = None,
+        rotation: Optional[str] = None,
+        retention: Optional[str] = None,
+        compression: bool = False,
+        buffer_size: int = 100,
+        time_format: str = "%Y-%m-%d %H:%M:%S",
+        retention_count: Optional[int] = None,
+        retention_size: Optional[str] = None,
+        max_open_files: int = 64,
+        max_destinations: int = 1024,
+        flush_interval: float = 1.0,
+        fallback: Optional[str] = None,
+    ):
+        super().__init__(level=level, formatter=formatter)
+        for _, field, _, _ in string.Formatter().parse(template):
+            if field is not None and (field == "" or field[0].isdigit()):
+                raise ValueError(f"Routing template needs named fields only: {template!r}")
+        self._template = template
+        self._fallback = fallback or os.path.join(os.path.dirname(template.split("{", 1)[0]) or ".", "unknown.log")
+        self._options = dict(
+            formatter=formatter,
+            rotation=rotation,
+            retention=retention,
+            compression=compression,
+            buffer_size=buffer_size,
+            time_format=time_format,
+            retention_count=retention_count,
+            retention_size=retention_size,
+        )
+        self._max_open_files = max_open_files
+        self._max_destinations = max_destinations
+        self._flush_interval = flush_interval
+
+        self._lock = threading.Lock()
+        self._destinations: Dict[str, _Destination] = {}
+        self._files = OrderedDict()
+        self._stop = threading.Event()
+
+        self._thread = threading.Thread(target=self._run, name="dlogger-routing", daemon=True)
+        self._thread.start()
+
+        atexit.register(self.close)
+
+    @property
+    def destinations(self) -> Dict[str, FileHandler]:
+        return dict(self._destinations)
+
+    def _resolve(self, record: LogRecord) -> str:
+        fields = _Fields(record.extra)
+        fields.setdefault("level", record.level.lower())
+        fields.setdefault("date", record.timestamp.strftime("%Y-%m-%d"))
+        try:
+            return self._template.format_map(fields)
+        except (ValueError, KeyError, IndexError, AttributeError, TypeError) as e:
+            print(f"⚠️ Routing template error: {e}")
+            return self._fallback
+
+    def _get_destination(self, path: str) -> _Destination:
+        destination = self._destinations.get(path)
+        if destination is not None:
+            destination._touched = True
+            return destination
+
+        evicted = []
+        with self._lock:
+            destination = self._destinations.get(path)
+            if destination is None:
+                if len(self._destinations) >= self._max_destinations:
+                    evicted = self._sweep()
+                destination = _Destination(self, path, **self._options)
+                self._destinations[path] = destination
+
+        # closing flushes through _write, which takes the router lock
+        for old in evicted:
+            old.close()
+        return destination
+
+    def _sweep(self) -> list:
+        """drop destinations not used since the previous sweep, oldest first, to stay under the cap."""
+        evicted = []
+        for path, destination in list(self._destinations.items()):
+            if destination._touched:
+                destination._touched = False
+                continue
+            evicted.append(self._destinations.pop(path))
+
+        while len(self._destinations) >= self._max_destinations:
+            evicted.append(self._destinations.pop(next(iter(self._destinations))))
+        return evicted
+
+    def emit(self, record: LogRecord):
+        """emit a log record to the file selected by the template."""
+        if not self._should_log(record):
+            return
+
+        self._get_destination(self._resolve(record)).emit(record)
+
+    def _write(self, path: str, lines: list):
+        with self._lock:
+            f = self._files.get(path)
+            if f is None:
+                f = open(path, "a", encoding="utf-8")
+                self._files[path] = f
+                while len(self._files) > self._max_open_files:
+                    _, oldest = self._files.popitem(last=False)
+                    oldest.close()
+            else:
+                self._files.move_to_end(path)
+
+            f.writelines(lines)
+            f.flush()
+
+    def _release(self, path: str):
+        with self._lock:
+            f = self._files.pop(path, None)
+            if f is not None:
+                f.close()
+
+    def _flush_all(self):
+        for destination in list(self._destinations.values()):
+            with destination._lock:
+                destination._flush_buffer()
+
+    def _run(self):
+        while not self._stop.wait(self._flush_interval):
+            self._flush_all()
+
+    def close(self):
+        """flush every destination and close open files."""
+        self._stop.set()
+        for destination in list(self._destinations.values()):
+            destination.close()
+
+        with self._lock:
+            for f in self._files.values():
+                f.close()
+            self._files.clear()
@@ -1,7 +1,4 @@
 
-import configparser
-
-
 def uvicorn_config(dlogger, logger_names=None):
     """generate uvicorn log config using dlogger.
     
@@ -44,6 +41,7 @@ def load(config_path: str = "dlogger.conf"):
     raises:
         FileNotFoundError: if config file does not exist
     """
+    import configparser
     import os
     
     if not os.path.exists(config_path):
@@ -71,6 +69,8 @@ def load(config_path: str = "dlogger.conf"):
         retention = config.get(section, "retention", fallback=None)
         compression = config.getboolean(section, "compression", fallback=False)
         time_format = config.get(section, "time_format", fallback="%Y-%m-%d %H:%M:%S")
+        retention_count = config.getint(section, "retention_count", fallback=None)
+        retention_size = config.get(section, "retention_size", fallback=None)
 
         lgr.configure(
             level=level,
@@ -79,6 +79,8 @@ def load(config_path: str = "dlogger.conf"):
             retention=retention,
             compression=compression,
             time_format=time_format,
+            retention_count=retention_count,
+            retention_size=retention_size,
         )
 
     root_logger = get_logger("root")
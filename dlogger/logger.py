@@ -2,12 +2,10 @@
 from datetime import datetime
 from typing import Optional, Literal, List
 import threading
-import inspect
+import atexit
+import sys
 
 from .handlers.base import Handler, LogRecord
-from .handlers.console import ConsoleHandler
-from .handlers.file import FileHandler
-from .formatters.exception import ExceptionFormatter
 
 class dLogger:
     """main logger class - facade over handlers."""
@@ -22,6 +20,8 @@ class dLogger:
         "CRITICAL": (50, "#f44336"),
     }
 
+    _profiler = None
+
     def __init__(self, name: str = None):
         self._name = name
         self._parent = None
@@ -29,9 +29,11 @@ class dLogger:
         self._handlers: List[Handler] = []
         self._lock = threading.Lock()
         self._context_cache = {}
-
-        if name is None:
-            self.add_handler(ConsoleHandler(level="TRACE"))
+        self._default_handler = name is None
+        self._level_set = False
+        self._configured = False
+        self._touched = False
+        self._extra = {}
 
     @property
     def name(self) -> str:
@@ -43,18 +45,69 @@ class dLogger:
 
     @property
     def handlers(self) -> List[Handler]:
+        self._ensure_default_handler()
         return self._handlers
 
+    def _ensure_default_handler(self):
+        """create the default console handler on first use instead of at import time."""
+        if not self._default_handler:
+            return
+
+        from .handlers.console import ConsoleHandler
+        with self._lock:
+            if self._default_handler:
+                self._handlers.append(ConsoleHandler(level="TRACE"))
+                self._default_handler = False
+
     def add_handler(self, handler: Handler):
         """add a handler to the logger."""
+        self._ensure_default_handler()
         with self._lock:
             self._handlers.append(handler)
+            self._configured = True
 
     def remove_handler(self, handler: Handler):
         """remove a handler from the logger."""
+        self._ensure_default_handler()
         with self._lock:
             if handler in self._handlers:
                 self._handlers.remove(handler)
+            self._configured = True
+
+    def bind(self, **fields) -> "dLogger":
+        """return a child logger that attaches fields to record.extra.
+
+        the child has no handlers of its own, so records go to this logger's handlers.
+        """
+        child = dLogger(name=self._name)
+        child._parent = self
+        child._default_handler = False
+        child._extra = {**self._extra, **fields}
+        return child
+
+    def set_level(self, level: str):
+        """set the logger's minimum log level."""
+        level_data = self.LEVELS.get(level.upper())
+        if level_data:
+            self._level = level_data[0]
+            self._level_set = True
+            self._configured = True
+
+    def set_handlers(self, handlers: List[Handler]):
+        """atomically replace the logger's handlers."""
+        with self._lock:
+            self._handlers = list(handlers)
+            self._default_handler = False
+            self._configured = True
+
+    def reset(self):
+        """drop handlers and level, returning the logger to its initial state."""
+        with self._lock:
+            self._handlers = []
+            self._level = 10
+            self._level_set = False
+            self._configured = False
+            self._default_handler = self._name is None
 
     def configure(
         self,
@@ -71,7 +124,9 @@ class dLogger:
             "%Y-%m-%dT%H:%M:%S",
             "%d/%m/%Y %H:%M:%S",
             "%Y-%m-%d %H:%M:%S.%f"
-        ] = "%Y-%m-%d %H:%M:%S"
+        ] = "%Y-%m-%d %H:%M:%S",
+        retention_count: Optional[int] = None,
+        retention_size: Optional[str] = None,
     ):
         """
         configure logger settings.
@@ -84,15 +139,29 @@ class dLogger:
             retention: How long to keep logs ("7 days", "1 month")
             compression: Compress old logs to .gz
             time_format: Time format string
+            retention_count: How many rotated logs to keep
+            retention_size: Total size budget for rotated logs ("500MB", "2GB")
         """
+        from .handlers.console import ConsoleHandler
+        from .handlers.file import FileHandler
+
         self._level = self.LEVELS.get(level.upper(), (10,))[0]
+        self._level_set = True
+        self._configured = True
 
+        self._ensure_default_handler()
         for handler in self._handlers:
             handler.set_level(level)
             if isinstance(handler, ConsoleHandler):
                 handler.show_path = show_path
 
         if log_file:
+            for handler in list(self._handlers):
+                if isinstance(handler, FileHandler) and handler.filename == log_file:
+                    self.remove_handler(handler)
+                    handler.close()
+                    atexit.unregister(handler.close)
+
             file_handler = FileHandler(
                 filename=log_file,
                 level=level,
@@ -100,13 +169,15 @@ class dLogger:
                 retention=retention,
                 compression=compression,
                 time_format=time_format,
+                retention_count=retention_count,
+                retention_size=retention_size,
             )
             self.add_handler(file_handler)
 
         return self
 
     def _get_context(self) -> str:
-        frame = inspect.currentframe()
+        frame = sys._getframe()
         try:
             caller_frame = frame.f_back
             if not caller_frame:
@@ -143,18 +214,25 @@ class dLogger:
         finally:
             del frame
 
-    def _log(self, level_name: str, msg: str, context: str = None):
+    def _log(self, level_name: str, msg: str, context: str = None, exc: Optional[BaseException] = None):
         level_data = self.LEVELS.get(level_name)
         if not level_data:
             return
 
         level_val, clr = level_data
-        effective_level = self._level
-        if self._parent and not self._handlers:
-            effective_level = self._parent._level
-        if level_val < effective_level:
+        level_owner = self
+        while not level_owner._level_set and level_owner._parent:
+            level_owner = level_owner._parent
+        if level_val < level_owner._level:
             return
 
+        source = self
+        while not source._handlers and source._parent:
+            source = source._parent
+
+        if source._default_handler:
+            source._ensure_default_handler()
+
         context = context or self._get_context()
         now = datetime.now()
 
@@ -165,12 +243,18 @@ class dLogger:
             context=context,
             timestamp=now,
             color=clr,
+            exc=exc,
+            extra=self._extra,
         )
 
-        handlers = self._handlers if self._handlers else (self._parent._handlers if self._parent else [])
+        profiler = self._profiler
+        if profiler is not None:
+            profiler.record(sys._getframe(2), record, source)
+            return
 
-        with self._lock:
-            for handler in handlers:
+        # emit under the owner's lock so set_handlers() waits for in-flight records
+        with source._lock:
+            for handler in source._handlers:
                 handler.emit(record)
 
     def trace(self, msg: str, context: str = None):
@@ -202,15 +286,16 @@ class dLogger:
             exc: exception object (optional, uses sys.exc_info() if not provided)
             context: context string (optional)
         """
+        from .formatters.exception import ExceptionFormatter
+
         if exc is None:
             exc = ExceptionFormatter.get_current_exception()
         
-        if exc:
-            tb = ExceptionFormatter.format_exception(exc)
-            full_msg = f"{msg}\n{tb}"
-        else:
-            full_msg = msg
-        
-        self._log("ERROR", full_msg, context)
+        self._log("ERROR", msg, context, exc)
+
+    def profile_report(self, top: int = 10, sort: Literal["records", "bytes", "time"] = "time") -> str:
+        """return the top-N call sites and handlers collected by dlogger.profile."""
+        from .profile import profiler
+        return profiler.report(top=top, sort=sort)
 
 logger = dLogger()
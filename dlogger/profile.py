@@ -0,0 +1,125 @@
+
+from time import perf_counter
+from typing import Literal
+import threading
+import sys
+
+class _Stats:
+    __slots__ = ("label", "records", "bytes", "time")
+
+    def __init__(self, label: str):
+        self.label = label
+        self.records = 0
+        self.bytes = 0
+        self.time = 0.0
+
+class Profiler:
+    """collects per call-site and per handler log volume and emit time."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sites = {}
+        self._handlers = {}
+
+    @property
+    def enabled(self) -> bool:
+        from .logger import dLogger
+        return dLogger._profiler is self
+
+    def enable(self):
+        """start collecting statistics for every dLogger."""
+        from .logger import dLogger
+        dLogger._profiler = self
+
+    def disable(self):
+        """stop collecting; disabled logging pays a single attribute check."""
+        from .logger import dLogger
+        if dLogger._profiler is self:
+            dLogger._profiler = None
+
+    def reset(self):
+        """drop collected statistics."""
+        with self._lock:
+            self._sites.clear()
+            self._handlers.clear()
+
+    def record(self, frame, record, source):
+        """emit a record through source's handlers while timing each of them."""
+        timings = []
+        with source._lock:
+            for handler in source._handlers:
+                start = perf_counter()
+                handler.emit(record)
+                timings.append((handler, perf_counter() - start))
+
+        # measured after the handlers ran so rendered tracebacks are counted
+        size = len(record.message.encode("utf-8", "replace"))
+        code = frame.f_code
+        key = (code.co_filename, frame.f_lineno)
+
+        with self._lock:
+            site = self._sites.get(key)
+            if site is None:
+                site = self._sites[key] = _Stats(f"{code.co_filename}:{frame.f_lineno} ({code.co_name})")
+            site.records += 1
+            site.bytes += size
+
+            for handler, elapsed in timings:
+                site.time += elapsed
+                stats = self._handlers.get(id(handler))
+                if stats is None:
+                    stats = self._handlers[id(handler)] = _Stats(f"{type(handler).__name__}@{id(handler):x}")
+                stats.records += 1
+                stats.bytes += size
+                stats.time += elapsed
+
+    def report(self, top: int = 10, sort: Literal["records", "bytes", "time"] = "time") -> str:
+        """
+        format the top-N call sites and handlers.
+
+        args:
+            top: how many rows to show per table
+            sort: column to sort by ("records", "bytes", "time")
+
+        returns:
+            report text
+        """
+        with self._lock:
+            sites = sorted(self._sites.values(), key=lambda s: getattr(s, sort), reverse=True)[:top]
+            handlers = sorted(self._handlers.values(), key=lambda s: getattr(s, sort), reverse=True)[:top]
+
+        lines = []
+        for title, rows in (("call site", sites), ("handler", handlers)):
+            lines.append(f"{title:<60} {'records':>10} {'bytes':>12} {'time ms':>10}")
+            for row in rows:
+                label = row.label if len(row.label) <= 60 else f"...{row.label[-57:]}"
+                lines.append(f"{label:<60} {row.records:>10} {row.bytes:>12} {row.time * 1000:>10.2f}")
+            lines.append("")
+        return "\n".join(lines)
+
+profiler = Profiler()
+
+def main(argv=None):
+    """run a script with profiling enabled and print the report on exit."""
+    import argparse
+    import runpy
+
+    parser = argparse.ArgumentParser(prog="python -m dlogger.profile")
+    parser.add_argument("-n", "--top", type=int, default=10, help="rows per table")
+    parser.add_argument("-s", "--sort", choices=("records", "bytes", "time"), default="time")
+    parser.add_argument("script", help="script to run")
+    parser.add_argument("args", nargs=argparse.REMAINDER)
+    options = parser.parse_args(argv)
+
+    sys.argv = [options.script] + options.args
+    profiler.enable()
+    try:
+        runpy.run_path(options.script, run_name="__main__")
+    finally:
+        profiler.disable()
+        print(profiler.report(top=options.top, sort=options.sort), file=sys.stderr)
+
+if __name__ == "__main__":
+    # run through the importable module so scripts share its profiler
+    from dlogger.profile import main
+    main()
@@ -0,0 +1,73 @@
+
+import threading
+import weakref
+
+from .logger import dLogger
+
+class LoggerRegistry:
+    """named logger registry with clock-style eviction and lazy parent linking."""
+
+    def __init__(self, capacity: int = 128):
+        self._capacity = capacity
+        self._threshold = capacity
+        self._loggers = {}
+        self._evicted = weakref.WeakValueDictionary()
+        self._placeholders = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._loggers)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._loggers or name in self._evicted
+
+    def get(self, name: str) -> dLogger:
+        """return the logger for name, creating it if needed."""
+        lgr = self._loggers.get(name)
+        if lgr is not None:
+            lgr._touched = True
+            return lgr
+
+        with self._lock:
+            lgr = self._loggers.get(name)
+            if lgr is None:
+                lgr = self._evicted.pop(name, None) or self._create(name)
+                if len(self._loggers) >= self._threshold:
+                    self._sweep()
+                self._loggers[name] = lgr
+            lgr._touched = True
+            return lgr
+
+    def _create(self, name: str) -> dLogger:
+        lgr = dLogger(name=name)
+
+        prefix = name
+        while "." in prefix:
+            prefix = prefix.rsplit(".", 1)[0]
+            parent = self._loggers.get(prefix) or self._evicted.get(prefix)
+            if parent is not None:
+                lgr._parent = parent
+                break
+            self._placeholders.setdefault(prefix, weakref.WeakSet()).add(lgr)
+
+        for child in self._placeholders.pop(name, ()):
+            if child._parent is None or len(child._parent.name) < len(name):
+                child._parent = lgr
+
+        return lgr
+
+    def _sweep(self):
+        """evict unconfigured loggers not used since the previous sweep."""
+        for name, lgr in list(self._loggers.items()):
+            if lgr._configured:
+                continue
+            if lgr._touched:
+                lgr._touched = False
+                continue
+            del self._loggers[name]
+            self._evicted[name] = lgr
+
+        for name in [n for n, children in self._placeholders.items() if not children]:
+            del self._placeholders[name]
+
+        self._threshold = max(self._capacity, 2 * len(self._loggers))
@@ -0,0 +1,37 @@
+import pytest
+
+from dlogger import dLogger, Handler
+
+
+class ListHandler(Handler):
+    """handler that keeps emitted messages in memory."""
+
+    def __init__(self, level="TRACE"):
+        super().__init__(level=level)
+        self.messages = []
+        self.flushed = False
+        self.closed = False
+
+    def emit(self, record):
+        if self._should_log(record):
+            self.messages.append(record.message)
+
+    def flush(self):
+        self.flushed = True
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def list_handler():
+    return ListHandler()
+
+
+@pytest.fixture
+def make_logger():
+    def make(handler, name="test"):
+        lgr = dLogger(name=name)
+        lgr.add_handler(handler)
+        return lgr
+    return make
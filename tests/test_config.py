@@ -0,0 +1,100 @@
+import json
+import threading
+import time
+
+import dlogger
+from dlogger import dict_config, file_config, get_logger
+
+
+def _config(path, level="INFO", with_root=True):
+    config = {
+        "handlers": {
+            "file": {"class": "FileHandler", "filename": str(path), "level": level},
+        },
+        "loggers": {
+            "cfg": {"level": level, "handlers": ["file"]},
+        },
+    }
+    if with_root:
+        config["loggers"]["root"] = {"level": "INFO"}
+    return config
+
+
+def teardown_function():
+    dict_config({})
+
+
+def test_reload_swaps_handlers_without_losing_records(tmp_path):
+    path = tmp_path / "app.log"
+    dict_config(_config(path, "INFO"))
+    lgr = get_logger("cfg")
+
+    stop = threading.Event()
+    sent = []
+
+    def writer():
+        i = 0
+        while not stop.is_set():
+            lgr.info(f"line {i}")
+            sent.append(i)
+            i += 1
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    for level in ("DEBUG", "INFO", "DEBUG", "INFO"):
+        time.sleep(0.02)
+        dict_config(_config(path, level))
+    stop.set()
+    thread.join()
+    dict_config({})
+
+    lines = path.read_text().splitlines()
+    assert len(lines) == len(sent)
+
+
+def test_unchanged_handler_is_reused(tmp_path):
+    path = tmp_path / "app.log"
+    dict_config(_config(path))
+    handler = get_logger("cfg").handlers[0]
+    dict_config(_config(path))
+    assert get_logger("cfg").handlers[0] is handler
+
+
+def test_removing_root_restores_default_console_handler(tmp_path):
+    dict_config(_config(tmp_path / "app.log", with_root=True))
+    dict_config(_config(tmp_path / "app.log", with_root=False))
+    assert [type(h).__name__ for h in dlogger.logger.handlers] == ["ConsoleHandler"]
+
+
+def test_dropping_handlers_key_detaches_closed_handlers(tmp_path):
+    dict_config(_config(tmp_path / "app.log"))
+    lgr = get_logger("cfg")
+    outside = dlogger.FileHandler(str(tmp_path / "outside.log"))
+    lgr.add_handler(outside)
+
+    dict_config({"loggers": {"cfg": {"level": "DEBUG"}}})
+
+    assert lgr.handlers == [outside]
+    outside.close()
+
+
+def test_file_config_watch_reloads_level(tmp_path):
+    log_path = tmp_path / "app.log"
+    conf = tmp_path / "dlogger.json"
+    conf.write_text(json.dumps(_config(log_path, "INFO")))
+    watcher = file_config(str(conf), watch=True, interval=0.05)
+    try:
+        lgr = get_logger("cfg")
+        lgr.debug("hidden")
+        time.sleep(0.05)
+        conf.write_text(json.dumps(_config(log_path, "DEBUG")) + " ")
+        deadline = time.time() + 2
+        while lgr._level != 10 and time.time() < deadline:
+            time.sleep(0.02)
+        lgr.debug("shown")
+    finally:
+        watcher.stop()
+        dict_config({})
+
+    text = log_path.read_text()
+    assert "shown" in text and "hidden" not in text
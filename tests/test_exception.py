@@ -0,0 +1,136 @@
+import logging
+import sys
+
+import pytest
+
+from dlogger.formatters.exception import ExceptionFormatter
+from dlogger.handlers.compat import CompatHandler
+
+
+@pytest.fixture(autouse=True)
+def formatter_defaults():
+    ExceptionFormatter.configure()
+    yield
+    ExceptionFormatter.configure()
+
+
+def _raise_from_same_line(value):
+    raise ValueError(value)
+
+
+def _recurse(depth):
+    if depth == 0:
+        raise RuntimeError("bottom")
+    _recurse(depth - 1)
+
+
+def _catch(fn, *args):
+    try:
+        fn(*args)
+    except BaseException as e:
+        return e
+
+
+def test_dropped_record_never_renders_traceback(list_handler, make_logger):
+    lgr = make_logger(list_handler)
+    lgr.set_level("CRITICAL")
+    records = []
+    list_handler.emit = records.append
+
+    lgr.exception("ignored", exc=_catch(_raise_from_same_line, "x"))
+    lgr.set_level("TRACE")
+    lgr.exception("kept", exc=_catch(_raise_from_same_line, "y"))
+
+    (record,) = records
+    assert record._rendered is False
+    assert "ValueError: y" in record.message
+    assert record._rendered is True
+
+
+def test_repeated_raises_hit_the_cache_with_fresh_tail():
+    first = ExceptionFormatter.format_exception(_catch(_raise_from_same_line, "first"))
+    assert len(ExceptionFormatter._cache) == 1
+    second = ExceptionFormatter.format_exception(_catch(_raise_from_same_line, "second"))
+
+    assert len(ExceptionFormatter._cache) == 1
+    assert first.endswith("ValueError: first\n")
+    assert second.endswith("ValueError: second\n")
+    assert first.rsplit("ValueError", 1)[0] == second.rsplit("ValueError", 1)[0]
+
+
+def _lookup(a, b):
+    return a["x"] + b["y"]
+
+
+def test_same_line_different_subexpressions_are_cached_apart():
+    missing_x = ExceptionFormatter.format_exception(_catch(_lookup, {}, {"y": 1}))
+    missing_y = ExceptionFormatter.format_exception(_catch(_lookup, {"x": 1}, {}))
+
+    assert len(ExceptionFormatter._cache) == 2
+    if sys.version_info >= (3, 11):
+        assert missing_x.rsplit("KeyError", 1)[0] != missing_y.rsplit("KeyError", 1)[0]
+
+
+def test_max_frames_keeps_innermost():
+    ExceptionFormatter.configure(max_frames=3)
+    text = ExceptionFormatter.format_exception(_catch(_recurse, 10))
+
+    assert "frames omitted" in text
+    assert text.count('File "') == 3
+    assert text.endswith("RuntimeError: bottom\n")
+
+
+def test_max_line_length_truncates():
+    ExceptionFormatter.configure(max_line_length=40)
+    text = ExceptionFormatter.format_exception(_catch(_raise_from_same_line, "v" * 200))
+
+    assert all(len(line) <= 43 for line in text.splitlines())
+    assert text.splitlines()[-1].endswith("...")
+
+
+def test_max_chain_depth_omits_oldest():
+    def chained(n):
+        if n == 0:
+            raise KeyError("root")
+        try:
+            chained(n - 1)
+        except Exception as e:
+            raise ValueError(f"level {n}") from e
+
+    ExceptionFormatter.configure(max_chain_depth=2)
+    text = ExceptionFormatter.format_exception(_catch(chained, 4))
+
+    assert text.startswith("... chained exceptions omitted ...")
+    assert "ValueError: level 4" in text and "ValueError: level 3" in text
+    assert "level 2" not in text and "KeyError" not in text
+
+
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="exception groups need 3.11")
+def test_exception_group_renders_sub_exceptions():
+    def group():
+        raise ExceptionGroup("grp", [_catch(_raise_from_same_line, "a"), TypeError("b")])
+
+    text = ExceptionFormatter.format_exception(_catch(group))
+
+    assert "ExceptionGroup: grp (2 sub-exceptions)" in text
+    assert "| ValueError: a" in text
+    assert "| TypeError: b" in text
+    assert "in _raise_from_same_line" in text
+
+
+def test_compat_handler_forwards_exc_info(list_handler, make_logger):
+    std = logging.getLogger("dlogger-test-compat")
+    std.propagate = False
+    handler = CompatHandler(make_logger(list_handler))
+    std.addHandler(handler)
+    try:
+        try:
+            raise ValueError("from logging")
+        except ValueError:
+            std.exception("std failed")
+    finally:
+        std.removeHandler(handler)
+
+    (message,) = list_handler.messages
+    assert message.startswith("std failed\n")
+    assert "ValueError: from logging" in message
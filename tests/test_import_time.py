@@ -0,0 +1,48 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ("dcolor", "logging", "gzip", "configparser", "inspect", "traceback", "json", "socket", "asyncio")
+
+
+def _run(code):
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _cumulative_us(stderr, module):
+    for line in stderr.splitlines():
+        parts = [p.strip() for p in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1])
+    raise AssertionError(f"{module} not found in importtime output")
+
+
+def test_import_does_not_load_heavy_modules():
+    result = _run(
+        "import sys, dlogger; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    assert result.stdout.strip() == ""
+
+
+def test_import_time_benchmark():
+    # best of several runs keeps the budget stable on noisy machines
+    best = min(_cumulative_us(_run("import dlogger").stderr, "dlogger") for _ in range(5))
+    print(f"import dlogger: {best / 1000:.1f}ms")
+    assert best < 100_000
+
+
+def test_lazy_names_resolve():
+    import dlogger
+
+    for name in dlogger.__all__:
+        assert getattr(dlogger, name) is not None
+    assert "RoutingFileHandler" in dir(dlogger.handlers)
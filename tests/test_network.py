@@ -0,0 +1,200 @@
+import json
+import socket
+import struct
+import threading
+import time
+
+import pytest
+
+from dlogger import dLogger, NetworkHandler
+
+
+class StreamCollector:
+    """local stand-in for a collector reading length-prefixed frames."""
+
+    def __init__(self, family, address):
+        self.messages = []
+        self._sock = socket.socket(family, socket.SOCK_STREAM)
+        if family == socket.AF_INET:
+            self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._sock.bind(address)
+        self._sock.listen()
+        self.address = self._sock.getsockname()
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        while True:
+            try:
+                conn, _ = self._sock.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._read, args=(conn,), daemon=True).start()
+
+    def _read(self, conn):
+        buffer = b""
+        while True:
+            data = conn.recv(65536)
+            if not data:
+                return
+            buffer += data
+            while len(buffer) >= 4:
+                (length,) = struct.unpack(">I", buffer[:4])
+                if len(buffer) < 4 + length:
+                    break
+                self.messages.append(json.loads(buffer[4:4 + length])["message"])
+                buffer = buffer[4 + length:]
+
+    def close(self):
+        self._sock.close()
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def _logger(handler):
+    lgr = dLogger(name="net")
+    lgr.add_handler(handler)
+    return lgr
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_tcp_batches_records():
+    collector = StreamCollector(socket.AF_INET, ("127.0.0.1", 0))
+    handler = NetworkHandler(collector.address, flush_interval=0.05)
+    lgr = _logger(handler)
+    for i in range(250):
+        lgr.info(f"record {i}")
+
+    assert _wait_for(lambda: len(collector.messages) == 250)
+    assert collector.messages == [f"record {i}" for i in range(250)]
+    handler.close()
+    collector.close()
+
+
+def test_udp_syslog():
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    receiver.bind(("127.0.0.1", 0))
+    receiver.settimeout(5)
+    handler = NetworkHandler(receiver.getsockname(), protocol="udp", format="syslog", flush_interval=0.05)
+    _logger(handler).warning("hello")
+
+    datagram = receiver.recv(65536).decode()
+    assert datagram.startswith("<12>1 ")
+    assert datagram.endswith("hello")
+    handler.close()
+    receiver.close()
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="unix sockets not available")
+def test_unix_datagram_socket(tmp_path):
+    address = str(tmp_path / "log.sock")
+    receiver = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    receiver.bind(address)
+    receiver.settimeout(5)
+    handler = NetworkHandler(address, protocol="unixgram", format="syslog", flush_interval=0.05)
+    _logger(handler).info("to /dev/log")
+
+    datagram = receiver.recv(65536).decode()
+    assert datagram.startswith("<14>1 ")
+    assert datagram.endswith("to /dev/log")
+    handler.close()
+    receiver.close()
+
+
+def test_queued_records_do_not_keep_tracebacks_alive():
+    handler = NetworkHandler(("127.0.0.1", _free_port()), flush_interval=60)
+    lgr = _logger(handler)
+    try:
+        raise ValueError("boom")
+    except ValueError as e:
+        lgr.exception("failed", exc=e)
+
+    (queued,) = handler._queue
+    assert queued.exc is None
+    assert queued.message.startswith("failed\n")
+    assert "ValueError: boom" in queued.message
+    handler.close()
+
+
+def test_tcp_spills_while_down_and_replays_in_order(tmp_path):
+    port = _free_port()
+    spill = tmp_path / "spill.bin"
+    handler = NetworkHandler(
+        ("127.0.0.1", port), spill_file=str(spill), flush_interval=0.05, backoff=0.05, batch_size=7,
+    )
+    lgr = _logger(handler)
+    for i in range(20):
+        lgr.info(f"down {i}")
+    assert _wait_for(spill.exists)
+
+    collector = StreamCollector(socket.AF_INET, ("127.0.0.1", port))
+    for i in range(5):
+        lgr.info(f"up {i}")
+
+    expected = [f"down {i}" for i in range(20)] + [f"up {i}" for i in range(5)]
+    assert _wait_for(lambda: len(collector.messages) == len(expected))
+    assert collector.messages == expected
+    assert not spill.exists()
+    assert handler.dropped == 0
+    handler.close()
+    collector.close()
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="unix sockets not available")
+def test_unix_spill_and_replay(tmp_path):
+    address = str(tmp_path / "collector.sock")
+    spill = tmp_path / "spill.bin"
+    handler = NetworkHandler(
+        address, protocol="unix", spill_file=str(spill), flush_interval=0.05, backoff=0.05,
+    )
+    lgr = _logger(handler)
+    lgr.info("while down")
+    assert _wait_for(spill.exists)
+
+    collector = StreamCollector(socket.AF_UNIX, address)
+    lgr.info("while up")
+    assert _wait_for(lambda: len(collector.messages) == 2)
+    assert collector.messages == ["while down", "while up"]
+    handler.close()
+    collector.close()
+
+
+def test_partial_replay_keeps_unsent_tail(tmp_path):
+    spill = tmp_path / "spill.bin"
+    handler = NetworkHandler(("127.0.0.1", _free_port()), spill_file=str(spill), flush_interval=60)
+    handler.close()
+    payloads = [f"p{i}".encode() for i in range(5)]
+    with open(spill, "wb") as f:
+        f.writelines(struct.pack(">I", len(p)) + p for p in payloads)
+
+    sent = []
+    handler._ensure_connected = lambda: True
+    handler._send = lambda batch: bool(sent) is False and not sent.append(batch)
+    handler._batch_size = 2
+
+    assert handler._replay() is False
+    assert sent == [payloads[:2]]
+    with open(spill, "rb") as f:
+        assert handler._read_frames(f, 10) == payloads[2:]
+
+
+def test_close_flushes_queue_from_worker_thread():
+    collector = StreamCollector(socket.AF_INET, ("127.0.0.1", 0))
+    handler = NetworkHandler(collector.address, flush_interval=60)
+    _logger(handler).info("queued")
+    handler.close()
+
+    assert not handler._thread.is_alive()
+    assert _wait_for(lambda: collector.messages == ["queued"])
+    collector.close()
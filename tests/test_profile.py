@@ -0,0 +1,35 @@
+import pytest
+
+from dlogger.profile import Profiler
+
+
+@pytest.fixture
+def profiler():
+    profiler = Profiler()
+    profiler.enable()
+    yield profiler
+    profiler.disable()
+
+
+def test_bytes_count_the_rendered_message(profiler, list_handler, make_logger):
+    lgr = make_logger(list_handler)
+    try:
+        raise ValueError("boom")
+    except ValueError as e:
+        lgr.exception("failed", exc=e)
+    profiler.disable()
+
+    (site,) = profiler._sites.values()
+    (stats,) = profiler._handlers.values()
+    rendered = list_handler.messages[0]
+    assert "ValueError" in rendered
+    assert site.bytes == stats.bytes == len(rendered.encode("utf-8"))
+
+
+def test_disabled_profiler_collects_nothing(profiler, list_handler, make_logger):
+    lgr = make_logger(list_handler)
+    profiler.disable()
+    lgr.info("quiet")
+
+    assert list_handler.messages == ["quiet"]
+    assert not profiler._sites
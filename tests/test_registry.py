@@ -0,0 +1,93 @@
+import gc
+import time
+
+from dlogger.registry import LoggerRegistry
+
+
+def test_parent_linked_regardless_of_creation_order():
+    registry = LoggerRegistry()
+    leaf = registry.get("a.b.c")
+    assert leaf.parent is None
+
+    root = registry.get("a")
+    assert leaf.parent is root
+
+    middle = registry.get("a.b")
+    assert leaf.parent is middle
+    assert middle.parent is root
+
+
+def test_records_reach_nearest_ancestor_with_handlers(list_handler):
+    registry = LoggerRegistry()
+    leaf = registry.get("svc.db.pool")
+    handler = list_handler
+    registry.get("svc").add_handler(handler)
+    registry.get("svc.db")
+
+    leaf.info("hello")
+    assert handler.messages == ["hello"]
+
+
+def test_level_resolved_from_nearest_ancestor_with_explicit_level(list_handler):
+    registry = LoggerRegistry()
+    app = registry.get("app")
+    handler = list_handler
+    app.add_handler(handler)
+    app.set_level("INFO")
+    registry.get("app.db").set_level("DEBUG")
+    pool = registry.get("app.db.pool")
+
+    pool.debug("pool debug")
+    registry.get("app.api").debug("api debug")
+    assert handler.messages == ["pool debug"]
+
+
+def test_configured_loggers_are_never_evicted():
+    registry = LoggerRegistry(capacity=8)
+    configured = registry.get("configured")
+    configured.set_level("INFO")
+
+    for i in range(100):
+        registry.get(f"tmp.{i}")
+
+    assert registry._loggers.get("configured") is configured
+    assert len(registry) < 100
+
+
+def test_evicted_logger_keeps_identity_while_referenced():
+    registry = LoggerRegistry(capacity=4)
+    held = registry.get("held")
+    for _ in range(3):
+        for i in range(20):
+            registry.get(f"tmp.{i}")
+
+    assert "held" not in registry._loggers
+    assert registry.get("held") is held
+
+
+def test_unreferenced_evicted_loggers_are_released():
+    registry = LoggerRegistry(capacity=4)
+    for _ in range(3):
+        for i in range(50):
+            registry.get(f"tmp.{i}")
+    gc.collect()
+
+    assert len(registry._loggers) + len(registry._evicted) < 50
+
+
+def test_lookup_benchmark_10k_names():
+    registry = LoggerRegistry()
+    names = [f"tenant{i}.module{i % 10}" for i in range(10_000)]
+
+    start = time.perf_counter()
+    loggers = [registry.get(name) for name in names]
+    create = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for name in names:
+        registry.get(name)
+    lookup = time.perf_counter() - start
+
+    print(f"create 10k: {create * 1000:.1f}ms, lookup 10k: {lookup * 1000:.1f}ms")
+    assert all(registry.get(n) is lgr for n, lgr in zip(names, loggers))
+    assert lookup < 1.0
@@ -0,0 +1,109 @@
+import os
+
+from dlogger.handlers.retention import SegmentManifest
+from dlogger.handlers.file import FileHandler
+
+
+def _touch(path, size=10):
+    with open(path, "wb") as f:
+        f.write(b"x" * size)
+
+
+def test_bootstrap_ignores_unrelated_files(tmp_path):
+    base = tmp_path / "app.log"
+    _touch(f"{base}.20200101_000000")
+    _touch(f"{base}.20200101_000000_1.gz")
+    _touch(f"{base}.bak")
+    _touch(tmp_path / "app.log.other.20200101_000000")
+
+    manifest = SegmentManifest(str(base))
+
+    names = [os.path.basename(p) for p, _, _ in manifest.segments]
+    assert names == ["app.log.20200101_000000", "app.log.20200101_000000_1.gz"]
+
+
+def test_next_name_does_not_reuse_deleted_names(tmp_path):
+    base = str(tmp_path / "app.log")
+    manifest = SegmentManifest(base, max_count=1)
+
+    first = manifest.next_name("20260101_000000")
+    _touch(first)
+    manifest.add(first)
+    second = manifest.next_name("20260101_000000")
+    _touch(second)
+    manifest.add(second)
+    manifest.enforce()
+
+    assert not os.path.exists(first)
+    third = manifest.next_name("20260101_000000")
+    assert third not in (first, second)
+    assert third.endswith("_2")
+
+
+def test_next_name_continues_after_restart(tmp_path):
+    base = str(tmp_path / "app.log")
+    manifest = SegmentManifest(base)
+    for _ in range(2):
+        name = manifest.next_name("20260101_000000")
+        _touch(name)
+        manifest.add(name)
+
+    reloaded = SegmentManifest(base)
+    assert reloaded.next_name("20260101_000000").endswith("_2")
+
+
+def test_duplicate_add_keeps_single_entry(tmp_path):
+    base = str(tmp_path / "app.log")
+    manifest = SegmentManifest(base, max_count=1)
+    path = f"{base}.20260101_000000"
+    _touch(path)
+    manifest.add(path)
+    manifest.add(path)
+
+    assert len(manifest.segments) == 1
+    manifest.enforce()
+    assert os.path.exists(path)
+
+
+def test_retention_by_bytes_and_journal_reload(tmp_path):
+    base = str(tmp_path / "app.log")
+    manifest = SegmentManifest(base, max_bytes=25)
+    paths = []
+    for i in range(4):
+        path = f"{base}.2026010{i + 1}_000000"
+        _touch(path, size=10)
+        manifest.add(path)
+        paths.append(path)
+    manifest.enforce()
+
+    assert [os.path.exists(p) for p in paths] == [False, False, True, True]
+    assert manifest.total_bytes == 20
+    assert SegmentManifest(base).segments == manifest.segments
+
+
+def test_journal_is_appended_and_compacted(tmp_path):
+    base = str(tmp_path / "app.log")
+    manifest = SegmentManifest(base, max_count=2)
+    for i in range(200):
+        path = manifest.next_name("20260101_000000")
+        _touch(path, size=1)
+        manifest.add(path)
+        manifest.enforce()
+
+    with open(f"{base}.manifest") as f:
+        lines = f.readlines()
+    assert len(lines) <= SegmentManifest._COMPACT_MIN + 2
+    assert SegmentManifest(base).segments == manifest.segments
+
+
+def test_file_handler_rotation_names_are_unique(tmp_path):
+    base = str(tmp_path / "app.log")
+    handler = FileHandler(base, rotation="1KB", retention_count=100, buffer_size=1)
+    for _ in range(20):
+        _touch(base, size=2048)
+        handler._rotate_log()
+    handler.close()
+
+    paths = [p for p, _, _ in handler._manifest.segments]
+    assert len(paths) == len(set(paths)) == 20
+    assert all(os.path.exists(p) for p in paths)
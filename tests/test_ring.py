@@ -0,0 +1,64 @@
+import asyncio
+import threading
+
+from dlogger import RingBufferHandler
+
+
+def test_dumps_window_on_trigger(list_handler, make_logger):
+    lgr = make_logger(RingBufferHandler(list_handler, capacity=3))
+    for i in range(5):
+        lgr.debug(f"debug {i}")
+    assert list_handler.messages == []
+
+    lgr.error("boom")
+    assert list_handler.messages == ["debug 2", "debug 3", "debug 4", "boom"]
+
+
+def test_exception_triggers_below_trigger_level(list_handler, make_logger):
+    lgr = make_logger(RingBufferHandler(list_handler, trigger_level="CRITICAL"))
+    lgr.debug("before")
+    try:
+        1 / 0
+    except ZeroDivisionError:
+        lgr.exception("failed")
+
+    assert list_handler.messages[0] == "before"
+    assert list_handler.messages[1].startswith("failed\n")
+
+
+def test_thread_scope_is_isolated(list_handler, make_logger):
+    lgr = make_logger(RingBufferHandler(list_handler, scope="thread"))
+    worker = threading.Thread(target=lambda: lgr.debug("other thread"))
+    worker.start()
+    worker.join()
+
+    lgr.debug("main thread")
+    lgr.error("boom")
+    assert list_handler.messages == ["main thread", "boom"]
+
+
+def test_context_scope_isolates_concurrent_tasks(list_handler, make_logger):
+    lgr = make_logger(RingBufferHandler(list_handler, scope="context"))
+
+    async def task(n):
+        lgr.debug(f"task {n} debug")
+        await asyncio.sleep(0.01)
+        if n == 1:
+            lgr.error("task 1 failed")
+
+    async def main():
+        lgr.debug("parent before tasks")
+        await asyncio.gather(task(1), task(2))
+
+    asyncio.run(main())
+    assert list_handler.messages == ["task 1 debug", "task 1 failed"]
+
+
+def test_close_closes_owned_target(list_handler):
+    RingBufferHandler(list_handler).close()
+    assert list_handler.closed
+
+
+def test_close_only_flushes_shared_target(list_handler):
+    RingBufferHandler(list_handler, close_target=False).close()
+    assert list_handler.flushed and not list_handler.closed
@@ -0,0 +1,76 @@
+import pytest
+
+from dlogger import dLogger, RoutingFileHandler
+
+
+def _read(path):
+    return path.read_text(encoding="utf-8") if path.exists() else ""
+
+
+def test_routes_by_bound_fields(tmp_path):
+    handler = RoutingFileHandler(str(tmp_path / "{tenant}.log"), buffer_size=1)
+    lgr = dLogger(name="routing")
+    lgr.add_handler(handler)
+    lgr.bind(tenant="acme").info("for acme")
+    lgr.bind(tenant="globex").info("for globex")
+    handler.close()
+
+    assert "for acme" in _read(tmp_path / "acme.log")
+    assert "for globex" in _read(tmp_path / "globex.log")
+
+
+def test_idle_destinations_are_evicted_under_the_cap(tmp_path):
+    handler = RoutingFileHandler(str(tmp_path / "{tenant}.log"), max_destinations=4, flush_interval=60)
+    lgr = dLogger(name="routing")
+    lgr.add_handler(handler)
+    for i in range(20):
+        lgr.bind(tenant=f"t{i}").info(f"record {i}")
+
+    assert len(handler.destinations) <= 4
+    assert len(handler._files) <= 4
+    # evicted destinations were flushed before they were dropped
+    assert "record 0" in _read(tmp_path / "t0.log")
+
+    handler.close()
+    for i in range(20):
+        assert f"record {i}" in _read(tmp_path / f"t{i}.log")
+
+
+def test_busy_destination_survives_a_sweep(tmp_path):
+    handler = RoutingFileHandler(str(tmp_path / "{tenant}.log"), max_destinations=3, flush_interval=60)
+    lgr = dLogger(name="routing")
+    lgr.add_handler(handler)
+    busy = lgr.bind(tenant="busy")
+    busy.info("tick")
+    destination = handler.destinations[str(tmp_path / "busy.log")]
+    for i in range(10):
+        busy.info("tick")
+        lgr.bind(tenant=f"t{i}").info("once")
+
+    assert handler.destinations[str(tmp_path / "busy.log")] is destination
+    handler.close()
+
+
+def test_positional_template_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        RoutingFileHandler(str(tmp_path / "{}.log"))
+    with pytest.raises(ValueError):
+        RoutingFileHandler(str(tmp_path / "{0}.log"))
+
+
+def test_format_error_falls_back(tmp_path, capsys):
+    handler = RoutingFileHandler(str(tmp_path / "{tenant:d}.log"), buffer_size=1)
+    lgr = dLogger(name="routing")
+    lgr.add_handler(handler)
+    lgr.bind(tenant="acme").info("unroutable")
+    handler.close()
+
+    assert "unroutable" in _read(tmp_path / "unknown.log")
+    assert "Routing template error" in capsys.readouterr().out
+
+
+def test_bound_logger_creates_root_console_handler(capsys):
+    root = dLogger()
+    root.bind(request="r1").info("bound first")
+
+    assert "bound first" in capsys.readouterr().out